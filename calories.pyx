@@ -0,0 +1,78 @@
+# cython: language_level=3
+"""Скомпилированные формулы расчёта калорий.
+
+Необязательное C-расширение для homework.py. Формулы повторяют
+running_calories(), walking_calories() и swimming_calories()
+из homework.py и должны меняться вместе с ними.
+
+Сборка: cythonize -i calories.pyx
+"""
+
+cimport cython
+from libc.math cimport copysign, floor, fmod
+
+
+@cython.cdivision(True)
+cdef double _floor_div(double a, double b) except? -1:
+    """Целочисленное деление как у float в Python.
+
+    Повторяет float_floor_div из CPython: floor(a / b) в C иногда
+    даёт на единицу больше, если частное округляется до целого.
+    """
+    cdef double mod, div, floordiv
+    if b == 0:
+        raise ZeroDivisionError('float floor division by zero')
+    mod = fmod(a, b)
+    div = (a - mod) / b
+    if mod and (b < 0) != (mod < 0):
+        div -= 1.0
+    if div:
+        floordiv = floor(div)
+        if div - floordiv > 0.5:
+            floordiv += 1.0
+        return floordiv
+    return copysign(0.0, a / b)
+
+
+cpdef double running_calories(
+    double speed,
+    double duration_min,
+    double weight,
+    double speed_multiplier,
+    double speed_shift,
+    double m_in_km,
+):
+    """Получить количество калорий, затраченных на бег."""
+    return (
+        (speed_multiplier * speed - speed_shift)
+        * weight
+        / m_in_km
+        * duration_min
+    )
+
+
+cpdef double walking_calories(
+    double speed,
+    double duration_min,
+    double weight,
+    double height,
+    double weight_multiplier,
+    double speed_and_weight_multiplier,
+):
+    """Получить количество калорий, затраченных на спортивную ходьбу."""
+    return (
+        weight_multiplier * weight
+        + _floor_div(speed * speed, height)
+        * speed_and_weight_multiplier
+        * weight
+    ) * duration_min
+
+
+cpdef double swimming_calories(
+    double speed,
+    double weight,
+    double speed_shift,
+    double weight_multiplier,
+):
+    """Получить количество калорий, затраченных на плавание."""
+    return (speed + speed_shift) * weight_multiplier * weight
@@ -5,8 +5,94 @@
 """
 
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Dict, Type, List
 
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Оставить функцию без изменений, если numba не установлена."""
+        def decorator(func):
+            return func
+        return decorator
+
+
+# Функции расчёта ниже принимают как числа, так и массивы numpy:
+# классы тренировок вызывают их для одной тренировки, main_batch() —
+# для столбцов пакета.
+
+
+def distance_km(action, len_step, m_in_km):
+    """Получить дистанцию в км."""
+    return action * len_step / m_in_km
+
+
+def speed_kmh(distance, duration):
+    """Получить среднюю скорость движения."""
+    return distance / duration
+
+
+def swimming_speed_kmh(length_pool, count_pool, m_in_km, duration):
+    """Получить среднюю скорость плавания."""
+    return length_pool * count_pool / m_in_km / duration
+
+
+@njit(cache=True)
+def running_calories(
+    speed,
+    duration_min,
+    weight,
+    speed_multiplier,
+    speed_shift,
+    m_in_km,
+):
+    """Получить количество калорий, затраченных на бег."""
+    return (
+        (speed_multiplier * speed - speed_shift)
+        * weight
+        / m_in_km
+        * duration_min
+    )
+
+
+@njit(cache=True)
+def walking_calories(
+    speed,
+    duration_min,
+    weight,
+    height,
+    weight_multiplier,
+    speed_and_weight_multiplier,
+):
+    """Получить количество калорий, затраченных на спортивную ходьбу."""
+    return (
+        weight_multiplier * weight
+        + (speed * speed // height)
+        * speed_and_weight_multiplier
+        * weight
+    ) * duration_min
+
+
+@njit(cache=True)
+def swimming_calories(speed, weight, speed_shift, weight_multiplier):
+    """Получить количество калорий, затраченных на плавание."""
+    return (speed + speed_shift) * weight_multiplier * weight
+
+
+try:
+    from calories import (
+        running_calories as running_calories_scalar,
+        walking_calories as walking_calories_scalar,
+        swimming_calories as swimming_calories_scalar,
+    )
+except ImportError:
+    running_calories_scalar = running_calories
+    walking_calories_scalar = walking_calories
+    swimming_calories_scalar = swimming_calories
+
 
 @dataclass
 class InfoMessage:
@@ -32,6 +118,8 @@ class InfoMessage:
         Возвращает строку сообщения с данными о тренировке.
     """
 
+    __slots__ = ('training_type', 'duration', 'distance', 'speed', 'calories')
+
     training_type: str
     duration: float
     distance: float
@@ -54,18 +142,28 @@ class Training:
 
     Attributes
     ----------
+    TYPE_NAME : str
+        Имя класса тренировки для информационного сообщения
     M_IN_KM : int
         Количество метров в одном километре
     MIN_IN_H : int
         Количество минут в одном часе
     LEN_STEP : float
         Длина одного шага или гребка
+    BATCH_COLUMNS : int
+        Количество столбцов в пакете данных для main_batch()
+    BATCH_NONZERO_COLUMNS : tuple
+        Столбцы пакета, на которые делятся формулы
     action : int
         Количество действий(шагов или гребков)
     duration_h : float
         Длительность тренировки
     weight_kg : float
-        Вес спортсмена.
+        Вес спортсмена
+    distance : float
+        Дистанция в км, вычисляется один раз
+    mean_speed : float
+        Средняя скорость, вычисляется один раз.
 
     Methods
     -------
@@ -78,12 +176,26 @@ class Training:
     show_training_info() : InfoMessage
         Создание объекта сообщения о результатах тренировки
     duration_min() : int
-        Перевод длительности тренировки из часов в минуты.
+        Перевод длительности тренировки из часов в минуты
+    batch_distance(data) : np.ndarray
+        Расчёт дистанции для пакета тренировок
+    batch_mean_speed(data, distance) : np.ndarray
+        Расчёт средней скорости для пакета тренировок
+    batch_spent_calories(data, speed) : np.ndarray
+        Расчёт потраченных калорий для пакета тренировок.
     """
 
+    TYPE_NAME = 'Training'
     M_IN_KM = 1000
     MIN_IN_H = 60
     LEN_STEP = 0.65
+    BATCH_COLUMNS = 3
+    BATCH_NONZERO_COLUMNS = (1,)
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Запомнить имя класса тренировки в TYPE_NAME."""
+        super().__init_subclass__(**kwargs)
+        cls.TYPE_NAME = cls.__name__
 
     def __init__(
         self,
@@ -107,13 +219,23 @@ class Training:
         self.duration_h = duration
         self.weight_kg = weight
 
+    @cached_property
+    def distance(self) -> float:
+        """Дистанция в км."""
+        return distance_km(self.action, self.LEN_STEP, self.M_IN_KM)
+
+    @cached_property
+    def mean_speed(self) -> float:
+        """Средняя скорость движения."""
+        return speed_kmh(self.distance, self.duration_h)
+
     def get_distance(self) -> float:
         """Получить дистанцию в км."""
-        return self.action * self.LEN_STEP / self.M_IN_KM
+        return self.distance
 
     def get_mean_speed(self) -> float:
         """Получить среднюю скорость движения."""
-        return self.get_distance() / self.duration_h
+        return self.mean_speed
 
     def get_spent_calories(self) -> float:
         """Получить количество затраченных калорий.
@@ -130,10 +252,10 @@ class Training:
     def show_training_info(self) -> InfoMessage:
         """Вернуть информационное сообщение о выполненной тренировке."""
         return InfoMessage(
-            type(self).__name__,
+            self.TYPE_NAME,
             self.duration_h,
-            self.get_distance(),
-            self.get_mean_speed(),
+            self.distance,
+            self.mean_speed,
             self.get_spent_calories(),
         )
 
@@ -141,6 +263,37 @@ class Training:
         """Вернуть время тренировки в минутах."""
         return self.duration_h * self.MIN_IN_H
 
+    @classmethod
+    def batch_distance(cls, data: np.ndarray) -> np.ndarray:
+        """Получить дистанцию в км для пакета тренировок."""
+        return distance_km(data[:, 0], cls.LEN_STEP, cls.M_IN_KM)
+
+    @classmethod
+    def batch_mean_speed(
+        cls,
+        data: np.ndarray,
+        distance: np.ndarray,
+    ) -> np.ndarray:
+        """Получить среднюю скорость для пакета тренировок."""
+        return speed_kmh(distance, data[:, 1])
+
+    @classmethod
+    def batch_spent_calories(
+        cls,
+        data: np.ndarray,
+        speed: np.ndarray,
+    ) -> np.ndarray:
+        """Получить количество затраченных калорий для пакета тренировок.
+
+        Raises
+        ------
+        NotImplementedError
+            Если не определен метод batch_spent_calories().
+        """
+        raise NotImplementedError(
+            f'Определить batch_spent_calories() в {cls.__name__}',
+        )
+
 
 class Running(Training):
     """Тренировка: бег.
@@ -155,7 +308,9 @@ class Running(Training):
     Methods
     -------
     get_spent_calories() : float
-        Расчёт количества потраченных калорий за тренировку.
+        Расчёт количества потраченных калорий за тренировку
+    batch_spent_calories(data, speed) : np.ndarray
+        Расчёт потраченных калорий для пакета тренировок.
     """
 
     CALORIES_AVG_SPEED_MULTIPLIER = 18
@@ -163,14 +318,29 @@ class Running(Training):
 
     def get_spent_calories(self) -> float:
         """Получить количество затраченных калорий."""
-        return (
-            (
-                self.CALORIES_AVG_SPEED_MULTIPLIER * self.get_mean_speed()
-                - self.CALORIES_AVG_SPEED_SHIFT
-            )
-            * self.weight_kg
-            / self.M_IN_KM
-            * self.duration_min()
+        return running_calories_scalar(
+            self.mean_speed,
+            self.duration_min(),
+            self.weight_kg,
+            self.CALORIES_AVG_SPEED_MULTIPLIER,
+            self.CALORIES_AVG_SPEED_SHIFT,
+            self.M_IN_KM,
+        )
+
+    @classmethod
+    def batch_spent_calories(
+        cls,
+        data: np.ndarray,
+        speed: np.ndarray,
+    ) -> np.ndarray:
+        """Получить количество затраченных калорий для пакета тренировок."""
+        return running_calories(
+            speed,
+            data[:, 1] * cls.MIN_IN_H,
+            data[:, 2],
+            cls.CALORIES_AVG_SPEED_MULTIPLIER,
+            cls.CALORIES_AVG_SPEED_SHIFT,
+            cls.M_IN_KM,
         )
 
 
@@ -189,11 +359,15 @@ class SportsWalking(Training):
     Methods
     -------
     get_spent_calories() : float
-        Расчёт количества потраченных калорий за тренировку.
+        Расчёт количества потраченных калорий за тренировку
+    batch_spent_calories(data, speed) : np.ndarray
+        Расчёт потраченных калорий для пакета тренировок.
     """
 
     CALORIES_WEIGHT_MULTIPLIER = 0.035
     CALORIES_AVG_SPEED_AND_WEIGHT_MULTIPLIER = 0.029
+    BATCH_COLUMNS = 4
+    BATCH_NONZERO_COLUMNS = (1, 3)
 
     def __init__(
         self,
@@ -221,12 +395,30 @@ class SportsWalking(Training):
 
     def get_spent_calories(self) -> float:
         """Получить количество затраченных калорий."""
-        return (
-            self.CALORIES_WEIGHT_MULTIPLIER * self.weight_kg
-            + (self.get_mean_speed() ** 2 // self.height_m)
-            * self.CALORIES_AVG_SPEED_AND_WEIGHT_MULTIPLIER
-            * self.weight_kg
-        ) * self.duration_min()
+        return walking_calories_scalar(
+            self.mean_speed,
+            self.duration_min(),
+            self.weight_kg,
+            self.height_m,
+            self.CALORIES_WEIGHT_MULTIPLIER,
+            self.CALORIES_AVG_SPEED_AND_WEIGHT_MULTIPLIER,
+        )
+
+    @classmethod
+    def batch_spent_calories(
+        cls,
+        data: np.ndarray,
+        speed: np.ndarray,
+    ) -> np.ndarray:
+        """Получить количество затраченных калорий для пакета тренировок."""
+        return walking_calories(
+            speed,
+            data[:, 1] * cls.MIN_IN_H,
+            data[:, 2],
+            data[:, 3],
+            cls.CALORIES_WEIGHT_MULTIPLIER,
+            cls.CALORIES_AVG_SPEED_AND_WEIGHT_MULTIPLIER,
+        )
 
 
 class Swimming(Training):
@@ -243,19 +435,24 @@ class Swimming(Training):
     length_pool_m : float
         Длина бассейна в метрах
     count_pool : int
-        Количество заплывов, совершенных спортсменом.
+        Количество заплывов, совершенных спортсменом
+    mean_speed : float
+        Средняя скорость плавания, вычисляется один раз.
 
     Methods
     -------
-    get_mean_speed() : float
-        Расчёт средней скорости движения во время тренировки
     get_spent_calories() : float
-        Расчёт количества потраченных калорий за тренировку.
+        Расчёт количества потраченных калорий за тренировку
+    batch_mean_speed(data, distance) : np.ndarray
+        Расчёт средней скорости для пакета тренировок
+    batch_spent_calories(data, speed) : np.ndarray
+        Расчёт потраченных калорий для пакета тренировок.
     """
 
     LEN_STEP = 1.38
     CALORIES_AVG_SPEED_SHIFT = 1.1
     CALORIES_WEIGHT_MULTIPLIER = 2
+    BATCH_COLUMNS = 5
 
     def __init__(
         self,
@@ -283,21 +480,48 @@ class Swimming(Training):
         self.length_pool_m = length_pool
         self.count_pool = count_pool
 
-    def get_mean_speed(self) -> float:
-        """Получить среднюю скорость движения."""
-        return (
-            self.length_pool_m
-            * self.count_pool
-            / self.M_IN_KM
-            / self.duration_h
+    @cached_property
+    def mean_speed(self) -> float:
+        """Средняя скорость движения."""
+        return swimming_speed_kmh(
+            self.length_pool_m,
+            self.count_pool,
+            self.M_IN_KM,
+            self.duration_h,
         )
 
     def get_spent_calories(self) -> float:
         """Получить количество затраченных калорий."""
-        return (
-            (self.get_mean_speed() + self.CALORIES_AVG_SPEED_SHIFT)
-            * self.CALORIES_WEIGHT_MULTIPLIER
-            * self.weight_kg
+        return swimming_calories_scalar(
+            self.mean_speed,
+            self.weight_kg,
+            self.CALORIES_AVG_SPEED_SHIFT,
+            self.CALORIES_WEIGHT_MULTIPLIER,
+        )
+
+    @classmethod
+    def batch_mean_speed(
+        cls,
+        data: np.ndarray,
+        distance: np.ndarray,
+    ) -> np.ndarray:
+        """Получить среднюю скорость для пакета тренировок."""
+        return swimming_speed_kmh(
+            data[:, 3], data[:, 4], cls.M_IN_KM, data[:, 1],
+        )
+
+    @classmethod
+    def batch_spent_calories(
+        cls,
+        data: np.ndarray,
+        speed: np.ndarray,
+    ) -> np.ndarray:
+        """Получить количество затраченных калорий для пакета тренировок."""
+        return swimming_calories(
+            speed,
+            data[:, 2],
+            cls.CALORIES_AVG_SPEED_SHIFT,
+            cls.CALORIES_WEIGHT_MULTIPLIER,
         )
 
 
@@ -333,13 +557,66 @@ def main(training: Training) -> None:
     print(training.show_training_info().get_message())  # noqa: T201
 
 
+BATCH_RESULT_FIELDS = ('duration', 'distance', 'speed', 'calories')
+
+
+def main_batch(packages: Dict[str, np.ndarray]) -> np.ndarray:
+    """Рассчитать результаты для пакетов тренировок, сгруппированных по типу.
+
+    Данные каждого типа передаются массивом формы (N, k), где столбцы
+    идут в том же порядке, что и аргументы конструктора класса тренировки.
+    Расчёт выполняется векторно, без создания объектов Training.
+
+    Raises
+    ------
+    InputDataError
+        Если поступили неправильные данные.
+    """
+    batches = []
+    for workout_type, data in packages.items():
+        training = TRAININGS.get(workout_type)
+        try:
+            data = np.asarray(data, dtype=float)
+        except (TypeError, ValueError):
+            raise InputDataError('Неправильные входные данные')
+        if (
+            training is None
+            or data.ndim != 2
+            or data.shape[1] != training.BATCH_COLUMNS
+            or not data[:, training.BATCH_NONZERO_COLUMNS].all()
+        ):
+            raise InputDataError('Неправильные входные данные')
+        distance = training.batch_distance(data)
+        speed = training.batch_mean_speed(data, distance)
+        calories = training.batch_spent_calories(data, speed)
+        batches.append((training, (data[:, 1], distance, speed, calories)))
+
+    width = max(
+        (len(training.TYPE_NAME) for training, _ in batches),
+        default=1,
+    )
+    dtype = np.dtype(
+        [('training_type', f'U{width}')]
+        + [(field, 'f8') for field in BATCH_RESULT_FIELDS]
+    )
+    results = [np.empty(0, dtype=dtype)]
+    for training, values in batches:
+        result = np.empty(len(values[0]), dtype=dtype)
+        result['training_type'] = training.TYPE_NAME
+        for field, value in zip(BATCH_RESULT_FIELDS, values):
+            result[field] = value
+        results.append(result)
+    return np.concatenate(results)
+
+
 if __name__ == '__main__':
-    packages = [
-        ('SWM', [720, 1, 80, 25, 40]),
-        ('RUN', [15000, 1, 75]),
-        ('WLK', [9000, 1, 75, 180]),
-    ]
-
-    for workout_type, data in packages:
-        training = read_package(workout_type, data)
-        main(training)
+    packages = {
+        'SWM': np.array([[720, 1, 80, 25, 40]]),
+        'RUN': np.array([[15000, 1, 75]]),
+        'WLK': np.array([[9000, 1, 75, 180]]),
+    }
+
+    results = main_batch(packages)
+    print('\n'.join(  # noqa: T201
+        InfoMessage(*row).get_message() for row in results.tolist()
+    ))
@@ -1,7 +1,14 @@
+import importlib.util
+import os
+import shutil
+import subprocess
 import sys
+import sysconfig
 from pathlib import Path
 from io import StringIO
 
+import pytest
+
 BASE_DIR = Path(__file__).resolve(strict=True).parent.parent
 sys.path.append(str(BASE_DIR))
 
@@ -25,3 +32,45 @@ class Capturing(list):
         self.extend(self._stringio.getvalue().splitlines())
         del self._stringio
         sys.stdout = self._stdout
+
+
+@pytest.fixture(scope='session')
+def calories_extension(tmp_path_factory):
+    """
+    Build the optional `calories` C extension into a temporary directory
+    and return the imported module. Skipped if Cython or a C compiler
+    is not available; a failed build fails with the compiler output.
+    """
+    pytest.importorskip('Cython')
+    compiler = (
+        os.environ.get('CC') or sysconfig.get_config_var('CC') or 'cc'
+    ).split()[0]
+    if shutil.which(compiler) is None:
+        pytest.skip(f'C compiler `{compiler}` not found')
+    build_dir = tmp_path_factory.mktemp('calories')
+    shutil.copy(BASE_DIR / 'calories.pyx', build_dir)
+    try:
+        subprocess.run(
+            [
+                sys.executable, '-m', 'Cython.Build.Cythonize',
+                '-i', 'calories.pyx',
+            ],
+            cwd=build_dir,
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+    except subprocess.CalledProcessError as exc:
+        pytest.fail(
+            f'Failed to build calories.pyx:\n{exc.stdout}\n{exc.stderr}'
+        )
+    built = [
+        path for path in build_dir.glob('calories*')
+        if path.suffix in ('.so', '.pyd')
+    ]
+    if not built:
+        pytest.fail(f'Built calories extension not found in {build_dir}')
+    spec = importlib.util.spec_from_file_location('calories', built[0])
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
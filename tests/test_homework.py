@@ -1,5 +1,7 @@
 import re
+import random
 import pytest
+import numpy as np
 import types
 import inspect
 from conftest import Capturing
@@ -403,3 +405,208 @@ def test_main_output(input_data, expected):
     assert (
         get_message_output == expected
     ), 'Метод `main` должен печатать результат в консоль.\n'
+
+
+def test_main_batch():
+    assert hasattr(
+        homework, 'main_batch'
+    ), 'Создайте функцию пакетной обработки `main_batch`.'
+    packages = {
+        'SWM': [[720, 1, 80, 25, 40], [420, 4, 20, 42, 4]],
+        'RUN': [[15000, 1, 75], [1206, 12, 6]],
+        'WLK': [[9000, 1, 75, 180], [420, 4, 20, 42]],
+    }
+    result = homework.main_batch(packages)
+    assert len(result) == 6, (
+        'Функция `main_batch` должна возвращать результат '
+        'для каждой тренировки.'
+    )
+    expected = [
+        homework.read_package(workout_type, data).show_training_info()
+        for workout_type, rows in packages.items()
+        for data in rows
+    ]
+    for row, info in zip(result, expected):
+        assert row['training_type'] == info.training_type
+        for field in ['duration', 'distance', 'speed', 'calories']:
+            assert row[field] == pytest.approx(getattr(info, field)), (
+                'Результаты `main_batch` должны совпадать '
+                f'с поштучным расчётом: поле {field}.'
+            )
+
+
+@pytest.mark.parametrize(
+    'packages',
+    [
+        {'XXX': [[720, 1, 80]]},
+        {'RUN': [[720, 1, 80, 25]]},
+        {'SWM': [720, 1, 80, 25, 40]},
+        {'RUN': [[1, 2, 3], [1, 2]]},
+        {'RUN': [['a', 1, 2]]},
+        {'RUN': [[100, 0, 70]]},
+        {'SWM': [[720, 0, 80, 25, 40]]},
+        {'WLK': [[9000, 1, 75, 180], [9000, 1, 75, 0]]},
+    ],
+)
+def test_main_batch_wrong_data(packages):
+    with pytest.raises(homework.InputDataError):
+        homework.main_batch(packages)
+
+
+@pytest.mark.parametrize(
+    'input_data',
+    [
+        ('SWM', [720, 1, 80, 25, 40]),
+        ('RUN', [15000, 1, 75]),
+        ('WLK', [9000, 1, 75, 180]),
+    ],
+)
+def test_Training_show_training_info_computes_once(monkeypatch, input_data):
+    calls = []
+    distance_km = homework.distance_km
+
+    def counting_distance_km(*args):
+        calls.append(args)
+        return distance_km(*args)
+
+    monkeypatch.setattr(homework, 'distance_km', counting_distance_km)
+    training = homework.read_package(*input_data)
+    training.show_training_info()
+    assert len(calls) == 1, (
+        'Дистанция должна вычисляться один раз за тренировку.'
+    )
+
+
+def test_InfoMessage_slots():
+    info_message = homework.InfoMessage('Running', 1, 2, 3, 4)
+    assert not hasattr(info_message, '__dict__'), (
+        'Объекты `InfoMessage` не должны хранить атрибуты в `__dict__`.'
+    )
+
+
+@pytest.mark.parametrize(
+    'kernel, args',
+    [
+        ('running_calories', (5.85, 60, 75, 18, 20, 1000)),
+        ('running_calories', (0.065325, 720, 6, 18, 20, 1000)),
+        ('walking_calories', (5.85, 60, 75, 180, 0.035, 0.029)),
+        ('walking_calories', (0.06825, 240, 20, 42, 0.035, 0.029)),
+        ('walking_calories', (5.531726674375732, 60, 75, 1.8, 0.035, 0.029)),
+        ('walking_calories', (1.0, 60, 75, 0.1, 0.035, 0.029)),
+        ('walking_calories', (1.0, 60, 75, -0.3, 0.035, 0.029)),
+        ('walking_calories', (0.0, 60, 75, 1.8, 0.035, 0.029)),
+        ('swimming_calories', (1.0, 80, 1.1, 2)),
+        ('swimming_calories', (0.005999999999999999, 6, 1.1, 2)),
+    ],
+)
+def test_calories_extension(calories_extension, kernel, args):
+    result = getattr(calories_extension, kernel)(*args)
+    assert result == getattr(homework, kernel)(*args), (
+        f'Функция `{kernel}` C-расширения должна совпадать '
+        'с реализацией в `homework.py`.'
+    )
+
+
+def test_calories_extension_floor_division(calories_extension):
+    rng = random.Random(0)
+    for _ in range(10000):
+        args = (
+            rng.uniform(0, 20),
+            60,
+            75,
+            rng.choice([0.1, 0.3, 1.8, rng.uniform(0.1, 2.5)]),
+            0.035,
+            0.029,
+        )
+        assert calories_extension.walking_calories(
+            *args
+        ) == homework.walking_calories(*args), (
+            'Функция `walking_calories` C-расширения должна совпадать '
+            f'с реализацией в `homework.py` для {args}.'
+        )
+    with pytest.raises(ZeroDivisionError):
+        calories_extension.walking_calories(1.0, 60, 75, 0, 0.035, 0.029)
+
+
+def test_Training_constants_override():
+    class SlowRunning(homework.Running):
+        CALORIES_AVG_SPEED_SHIFT = 0
+
+    result = SlowRunning(9000, 1, 75).get_spent_calories()
+    assert result == 18 * 5.85 * 75 / 1000 * 60, (
+        'Константы класса тренировки должны учитываться '
+        'при расчёте калорий.'
+    )
+
+
+@pytest.mark.parametrize(
+    'training_class',
+    ['Training', 'Running', 'SportsWalking', 'Swimming'],
+)
+def test_Training_TYPE_NAME(training_class):
+    assert getattr(homework, training_class).TYPE_NAME == training_class, (
+        'Атрибут `TYPE_NAME` должен совпадать с именем класса тренировки.'
+    )
+
+
+def test_main_batch_registered_training(monkeypatch):
+    class InterplanetaryRunning(homework.Running):
+        CALORIES_AVG_SPEED_SHIFT = 0
+
+    monkeypatch.setitem(homework.TRAININGS, 'IPR', InterplanetaryRunning)
+    result = homework.main_batch(
+        {'IPR': [[9000, 1, 75]], 'RUN': [[9000, 1, 75]]}
+    )
+    expected = [
+        InterplanetaryRunning(9000, 1, 75).show_training_info(),
+        homework.Running(9000, 1, 75).show_training_info(),
+    ]
+    for row, info in zip(result, expected):
+        assert row['training_type'] == info.training_type, (
+            '`main_batch` должна сохранять полное имя класса тренировки.'
+        )
+        assert row['calories'] == pytest.approx(info.calories), (
+            '`main_batch` должна использовать формулы класса тренировки.'
+        )
+
+
+@pytest.mark.parametrize(
+    'kernel, make_args',
+    [
+        (
+            'running_calories',
+            lambda rng: (
+                rng.uniform(0, 20), rng.uniform(1, 300), rng.uniform(40, 120),
+                18, 20, 1000,
+            ),
+        ),
+        (
+            'walking_calories',
+            lambda rng: (
+                rng.uniform(0, 20), rng.uniform(1, 300), rng.uniform(40, 120),
+                rng.choice([0.1, 0.3, 1.8, rng.uniform(0.1, 2.5)]),
+                0.035, 0.029,
+            ),
+        ),
+        (
+            'swimming_calories',
+            lambda rng: (rng.uniform(0, 5), rng.uniform(40, 120), 1.1, 2),
+        ),
+    ],
+)
+def test_calories_numba(kernel, make_args):
+    pytest.importorskip('numba')
+    compiled = getattr(homework, kernel)
+    python = compiled.py_func
+    rng = random.Random(0)
+    rows = [make_args(rng) for _ in range(1000)]
+    for args in rows:
+        assert compiled(*args) == python(*args), (
+            f'Функция `{kernel}`, скомпилированная numba, должна совпадать '
+            f'с формулой на Python для {args}.'
+        )
+    columns = [np.array(column) for column in zip(*rows)]
+    assert np.array_equal(compiled(*columns), python(*columns)), (
+        f'Функция `{kernel}`, скомпилированная numba, должна совпадать '
+        'с формулой на Python для массивов numpy.'
+    )